@@ -9,10 +9,12 @@ in a separate thread based on a configured interval.
 
 __author__ = 'sora7672'
 
-from pynput import mouse, keyboard
+from pynput import mouse
 from pynput.mouse import Button as MouseButton
 from threading import Thread, Lock, Event
-from time import sleep
+from time import sleep, monotonic_ns, perf_counter_ns
+import sys
+import ctypes
 
 from config_loader import ConfigHolder
 
@@ -30,15 +32,84 @@ from config_loader import ConfigHolder
 #     keyboard_controller.release(key_name)
 
 
+# Time a click is held down between press and release
+CLICK_HOLD_MS: int = 5
+# Below this interval the hold would eat most of the click period, so clicks are sent instantly
+HOLD_CLICK_MIN_INTERVAL: int = 20
+# Sleeps may overshoot by up to one timer tick (1ms while clicking), so the last part of a wait is spun out
+_SPIN_NS: int = 1_000_000
+
+
 def wait_ms(ms:int) -> None:
     """
     Waits for a specified duration in milliseconds.
+    Sleeps for most of the duration and busy-waits the last millisecond on the
+    performance counter, so the wait stays precise without spinning the whole time.
 
     :param ms: int (Duration to wait in milliseconds)
     :return: None (no return value)
     """
 
-    sleep(ms/1000)
+    deadline_ns = perf_counter_ns() + ms * 1_000_000
+    sleep_ns = deadline_ns - _SPIN_NS - perf_counter_ns()
+    if sleep_ns > 0:
+        sleep(sleep_ns / 1_000_000_000)
+    while perf_counter_ns() < deadline_ns:
+        pass
+
+
+_MOUSE = None
+_MOUSE_LOCK = Lock()
+
+
+def get_mouse_controller() -> mouse.Controller:
+    """
+    Returns the shared mouse controller, creating it on first use.
+    Created lazily to avoid opening the input handles at import time.
+
+    :return: mouse.Controller (The module wide mouse controller)
+    """
+
+    global _MOUSE
+    with _MOUSE_LOCK:
+        if _MOUSE is None:
+            _MOUSE = mouse.Controller()
+        return _MOUSE
+
+
+def begin_timer_resolution() -> None:
+    """
+    Requests a 1ms system timer resolution on Windows, where sleeps and waits otherwise
+    round up to the default ~15.6ms tick. Other platforms already sleep with high resolution.
+
+    :return: None (no return value)
+    """
+
+    if sys.platform == "win32":
+        ctypes.windll.winmm.timeBeginPeriod(1)
+
+
+def end_timer_resolution() -> None:
+    """
+    Releases the timer resolution requested by begin_timer_resolution().
+
+    :return: None (no return value)
+    """
+
+    if sys.platform == "win32":
+        ctypes.windll.winmm.timeEndPeriod(1)
+
+
+def wait_until_ns(deadline_ns: int, stop_event: Event) -> bool:
+    """
+    Waits until the given monotonic deadline is reached or the stop event gets set.
+
+    :param deadline_ns: int (Absolute deadline based on time.monotonic_ns())
+    :param stop_event: Event (Event that interrupts the wait when set)
+    :return: bool (True if the stop event was set, False if the deadline was reached)
+    """
+
+    return stop_event.wait(max(0, deadline_ns - monotonic_ns()) / 1_000_000_000)
 
 
 class AutoClicker:
@@ -47,11 +118,11 @@ class AutoClicker:
 
     Attributes:
         _initialized (bool): Ensures initialization runs only once
-        _lock (Lock): Thread lock for potential synchronization (unused currently)
-        _stop_event (Event): Signal to start or stop the click worker
-        _thread (Thread): The worker thread executing clicks
-        _mouse_controller (Controller): Controls mouse actions
-        _keyboard_controller (Controller): Controls keyboard actions (unused)
+        _lock (Lock): Keeps the run and stop events consistent while switching state
+        _run_event (Event): Set while the click worker should be clicking
+        _stop_event (Event): Set while the clicker is stopped, wakes the worker mid-interval
+        _shutdown_event (Event): Signals the worker thread to terminate
+        _thread (Thread): The long-lived worker thread executing clicks
         _mouse_click_interval (int): Interval between clicks in milliseconds
     """
 
@@ -80,56 +151,95 @@ class AutoClicker:
 
         self._initialized: bool = True
         self._lock = Lock()
+        self._run_event = Event()
         self._stop_event = Event()
         self._stop_event.set()
+        self._shutdown_event = Event()
 
         self._thread = Thread(target=self._click_worker, daemon=True)
-        self._mouse_controller = mouse.Controller()
-        self._keyboard_controller = keyboard.Controller()
 
         self._mouse_click_interval = ConfigHolder().interval_clicks
 
+        self._thread.start()
+
 
     def _click_worker(self) -> None:
         """
-        Internal worker method executed by the background thread.
+        Internal worker method executed by the long-lived background thread.
 
-        Performs left mouse clicks in a loop with the configured interval,
-        until the stop event is triggered.
+        Idles on the run event and, while it is set, performs left mouse clicks
+        with the configured interval until the stop event is triggered.
+        Each click targets an absolute deadline (start + k * interval), so the time
+        spent clicking does not add up to a drift of the click rate.
+        Clicks are held for CLICK_HOLD_MS, unless the interval is shorter than
+        HOLD_CLICK_MIN_INTERVAL, then press and release are sent back to back.
 
         :return: None (no return value)
         """
 
-        while not self._stop_event.is_set():
-            wait_ms(self._mouse_click_interval)
-            self._mouse_controller.press(MouseButton.left)
-            wait_ms(5)
-            self._mouse_controller.release(MouseButton.left)
+        mouse_controller = get_mouse_controller()
+        interval_ns = self._mouse_click_interval * 1_000_000
+        hold_click = self._mouse_click_interval >= HOLD_CLICK_MIN_INTERVAL
+        while True:
+            self._run_event.wait()
+            if self._shutdown_event.is_set():
+                return
+
+            next_click_ns = monotonic_ns() + interval_ns
+            while not wait_until_ns(next_click_ns, self._stop_event):
+                if hold_click:
+                    mouse_controller.press(MouseButton.left)
+                    wait_ms(CLICK_HOLD_MS)
+                    mouse_controller.release(MouseButton.left)
+                else:
+                    mouse_controller.click(MouseButton.left, 1)
+
+                next_click_ns += interval_ns
+                # skip missed clicks instead of bursting after a stall (e.g. system suspend)
+                now_ns = monotonic_ns()
+                if next_click_ns < now_ns:
+                    next_click_ns = now_ns + interval_ns - (now_ns - next_click_ns) % interval_ns
 
     def start_clicker(self) -> None:
         """
-        Starts the clicker if it is currently stopped by launching the worker thread.
+        Starts the clicker if it is currently stopped by waking up the worker thread.
 
         :return: None (no return value)
         """
 
-        if self._stop_event.is_set():
-            self._stop_event.clear()
-            self._thread = Thread(target=self._click_worker, daemon=True)
-            self._thread.start()
+        with self._lock:
+            if self._stop_event.is_set() and not self._shutdown_event.is_set():
+                begin_timer_resolution()
+                self._stop_event.clear()
+                self._run_event.set()
 
     def stop_clicker(self) -> None:
         """
-        Stops the clicker if it is currently running by signaling the stop event
-        and joining the worker thread.
+        Stops the clicker if it is currently running by signaling the stop event.
+        The worker thread stays alive and idles until the next start.
 
         :return: None (no return value)
         """
 
-        if not self._stop_event.is_set():
-            self._stop_event.set()
-            if self._thread.is_alive():
-                self._thread.join()
+        with self._lock:
+            if not self._stop_event.is_set():
+                self._run_event.clear()
+                self._stop_event.set()
+                end_timer_resolution()
+
+    def shutdown_clicker(self) -> None:
+        """
+        Stops the clicker and terminates the worker thread.
+
+        :return: None (no return value)
+        """
+
+        self.stop_clicker()
+        with self._lock:
+            self._shutdown_event.set()
+            self._run_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
 
     def is_clicker_alive(self) -> bool:
         """
@@ -141,7 +251,7 @@ class AutoClicker:
         """
 
         raise NotImplementedError("clicker alive is faulty, needs better handling!")
-        return self._stop_event.is_set()
+        return self._run_event.is_set()
 
 def stop_clicker() -> None:
     """
@@ -152,6 +262,17 @@ def stop_clicker() -> None:
 
     AutoClicker().stop_clicker()
 
+def shutdown_clicker() -> None:
+    """
+    Stops the singleton AutoClicker instance and terminates its worker thread.
+    Does nothing if the clicker was never created, to avoid creating it just for shutdown.
+
+    :return: None (no return value)
+    """
+
+    if AutoClicker._instance is not None:
+        AutoClicker().shutdown_clicker()
+
 def start_clicker() -> None:
     """
     Starts the singleton AutoClicker instance.
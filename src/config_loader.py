@@ -17,38 +17,82 @@ from datetime import datetime
 from pynput import keyboard
 
 
+# __members__ also contains aliases, so every name hasattr(keyboard.Key, ...) accepts is in here
+_VALID_SPECIAL: frozenset[str] = frozenset(keyboard.Key.__members__)
+
+
+def validate_keys(key_tuple) -> frozenset:
+    """
+    Validates that all entries in the key tuple are proper key strings.
+
+    :param key_tuple: tuple (Tuple of key names to validate)
+    :return: frozenset (Set of validated key names)
+    :raises TypeError: If a key is not a string
+    :raises ValueError: If a key is not lowercase or invalid as a special key
+    """
+
+    for key_value in key_tuple:
+        if not isinstance(key_value, str):
+            raise TypeError(f'From ({key_tuple}) - Key {key_value} is not a string.')
+
+        if len(key_value) == 1 and not key_value.islower():
+            raise ValueError(f'From ({key_tuple}) - Key {key_value} is not lower case.')
+
+        if len(key_value) != 1 and key_value.lower() not in _VALID_SPECIAL:
+            raise ValueError(f'From ({key_tuple}) - Key "{key_value}" is not a valid special key.')
+
+    return frozenset(key_tuple)
+
+
+def sort_key_combo(key_combo) -> list:
+    """
+    Orders a key combo for display and saving, special keys first (e.g. shift, s).
+
+    :param key_combo: frozenset (Key names of the combo)
+    :return: list (Sorted key names)
+    """
+
+    return sorted(key_combo, key=lambda k: (len(k) == 1, k))
+
+
 class ConfigHolder:
     """
     Singleton class for loading, validating, and persisting configuration settings.
 
     Attributes:
-        _lock (Lock): Ensures thread-safe access to configuration values
+        _singleton_lock (Lock): Guards creation and initialization of the singleton
+        _lock (Lock): Guards the configuration values while they are loaded or saved
         _file_name (str): Name of the JSON file containing settings
         _path (str): Optional custom path for config storage
         _project_path (str): Root path of the project (used if _path is not set)
         _file_path (str): Full resolved path to the JSON config file
-        _start_key_combo (tuple): Keys to start the clicker
-        _stop_key_combo (tuple): Keys to stop the clicker
-        _exit_key_combo (tuple): Keys to exit the program
+        _start_key_combo (frozenset): Keys to start the clicker
+        _stop_key_combo (frozenset): Keys to stop the clicker
+        _exit_key_combo (frozenset): Keys to exit the program
         _interval_clicks (int): Time between clicks in milliseconds
     """
 
     _instance = None
+    _singleton_lock = Lock()
 
     def __new__(cls, *args, **kwargs):
         """
         Creates and returns the singleton instance of ConfigHolder.
+        Uses double-checked locking, so only the first calls pay for the lock.
 
         :return: ConfigHolder (The singleton instance)
         """
 
         if cls._instance is None:
-            cls._instance = super(cls, cls).__new__(cls)
+            with cls._singleton_lock:
+                if cls._instance is None:
+                    cls._instance = super(cls, cls).__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
         """
         Initializes the configuration, sets default values, and loads from file if available.
+        Marked as initialized only after loading, so other threads never see default values.
 
         :return: None (no return value)
         """
@@ -56,28 +100,32 @@ class ConfigHolder:
         if hasattr(self, '_initialized'):
             return
 
-        self._initialized = True
-        self._lock = Lock()
+        with self._singleton_lock:
+            if hasattr(self, '_initialized'):
+                return
 
-        self._file_name: str = "config.json"
-        self._path: str = ""
-        self._project_path = path.abspath(path.join(path.dirname(__file__), '..'))
-        if self._path:
-            self._path = path.abspath(self._path)
-            if not path.exists(self._path):
-                makedirs(self._path, exist_ok=True)
-            self._file_path: str = path.join(self._path, self._file_name)
-        else:
-            self._file_path: str = path.join(self._project_path, self._file_name)
+            self._lock = Lock()
 
-        # set default keys
-        self._start_key_combo: tuple = ("shift", "s")
-        self._stop_key_combo: tuple = ("shift", "s")
-        self._exit_key_combo: tuple = ("shift", "e")
+            self._file_name: str = "config.json"
+            self._path: str = ""
+            self._project_path = path.abspath(path.join(path.dirname(__file__), '..'))
+            if self._path:
+                self._path = path.abspath(self._path)
+                if not path.exists(self._path):
+                    makedirs(self._path, exist_ok=True)
+                self._file_path: str = path.join(self._path, self._file_name)
+            else:
+                self._file_path: str = path.join(self._project_path, self._file_name)
 
-        self._interval_clicks: int = 100  # 10x per second
+            # set default keys
+            self._start_key_combo: frozenset = frozenset(("shift", "s"))
+            self._stop_key_combo: frozenset = frozenset(("shift", "s"))
+            self._exit_key_combo: frozenset = frozenset(("shift", "e"))
 
-        self.__read_in_settings()
+            self._interval_clicks: int = 100  # 10x per second
+
+            self.__read_in_settings()
+            self._initialized = True
 
     def __read_in_settings(self) -> None:
         """
@@ -93,16 +141,20 @@ class ConfigHolder:
             self.__save_settings()
             return
 
-        with open(self._file_path, 'r') as file:
-            content = file.read().strip()
-        if content == "":
+        if path.getsize(self._file_path) == 0:
             warn(f"The file {self._file_path} is empty. Using default settings.")
             self.__save_settings()
             return
 
         try:
-            tmp_config = json.loads(content)
-        except json.JSONDecodeError:
+            with open(self._file_path, 'r') as file:
+                tmp_config = json.load(file)
+        except ValueError as exc:  # JSONDecodeError and UnicodeDecodeError
+            # a whitespace-only file (e.g. a single newline left by an editor) counts as empty
+            if isinstance(exc, json.JSONDecodeError) and exc.doc.isspace():
+                warn(f"The file {self._file_path} is empty. Using default settings.")
+                self.__save_settings()
+                return
             warn(f"The file {self._file_path} contains invalid JSON. Using default settings.")
             self.__save_broken_json()
             self.__save_settings()
@@ -131,35 +183,13 @@ class ConfigHolder:
 
 
         with self._lock:
-            self._start_key_combo = self.__validate_keys(tmp_config["_start_key_combo"])
-            self._stop_key_combo = self.__validate_keys(tmp_config["_stop_key_combo"])
-            self._exit_key_combo = self.__validate_keys(tmp_config["_exit_key_combo"])
+            self._start_key_combo = validate_keys(tmp_config["_start_key_combo"])
+            self._stop_key_combo = validate_keys(tmp_config["_stop_key_combo"])
+            self._exit_key_combo = validate_keys(tmp_config["_exit_key_combo"])
 
 
             self._interval_clicks = tmp_config["_interval_clicks"]
 
-    def __validate_keys(self, key_tuple) -> set:
-        """
-        Validates that all entries in the key tuple are proper key strings.
-
-        :param key_tuple: tuple (Tuple of key names to validate)
-        :return: set (Set of validated key names)
-        :raises TypeError: If a key is not a string
-        :raises ValueError: If a key is not lowercase or invalid as a special key
-        """
-        # TODO: Outsource duplication
-        for key_value in key_tuple:
-            if not isinstance(key_value, str):
-                raise TypeError(f'From ({key_tuple}) - Key {key_value} is not a string.')
-
-            if len(key_value) == 1 and not key_value.islower():
-                raise ValueError(f'From ({key_tuple}) - Key {key_value} is not lower case.')
-
-            if len(key_value) != 1 and not hasattr(keyboard.Key, key_value.lower()):
-                raise ValueError(f'From ({key_tuple}) - Key "{key_value}" is not a valid special key.')
-
-        return set(key_tuple)
-
     def __save_settings(self) -> None:
         """
         Saves the current configuration to the JSON file.
@@ -170,9 +200,9 @@ class ConfigHolder:
         tmp_config = dict()
 
         with self._lock:
-            tmp_config["_start_key_combo"] = self._start_key_combo
-            tmp_config["_stop_key_combo"] = self._stop_key_combo
-            tmp_config["_exit_key_combo"] = self._exit_key_combo
+            tmp_config["_start_key_combo"] = sort_key_combo(self._start_key_combo)
+            tmp_config["_stop_key_combo"] = sort_key_combo(self._stop_key_combo)
+            tmp_config["_exit_key_combo"] = sort_key_combo(self._exit_key_combo)
             tmp_config["_interval_clicks"] = self._interval_clicks
 
         with open(self._file_path, 'w') as file:
@@ -189,37 +219,36 @@ class ConfigHolder:
         current_datetime = current_datetime.strftime('%Y%m%d-%H%M%S')
         rename(self._file_path, f"{current_datetime}_broken_{self._file_name}")
 
+    # The values are only written while loading, so the getters skip the lock.
+
     @property
-    def start_key_combo(self) -> tuple:
+    def start_key_combo(self) -> frozenset:
         """
         Gets the configured key combination for starting the clicker.
 
-        :return: tuple (Start key combination)
+        :return: frozenset (Start key combination)
         """
 
-        with self._lock:
-            return self._start_key_combo
+        return self._start_key_combo
 
     @property
-    def stop_key_combo(self) -> tuple:
+    def stop_key_combo(self) -> frozenset:
         """
         Gets the configured key combination for stopping the clicker.
 
-        :return: tuple (Stop key combination)
+        :return: frozenset (Stop key combination)
         """
 
-        with self._lock:
-            return self._stop_key_combo
+        return self._stop_key_combo
 
     @property
-    def exit_key_combo(self) -> tuple:
+    def exit_key_combo(self) -> frozenset:
         """
         Gets the configured key combination for exiting the application.
 
-        :return: tuple (Exit key combination)
+        :return: frozenset (Exit key combination)
         """
-        with self._lock:
-            return self._exit_key_combo
+        return self._exit_key_combo
 
     @property
     def interval_clicks(self) -> int:
@@ -229,8 +258,7 @@ class ConfigHolder:
         :return: int (Click interval in ms)
         """
 
-        with self._lock:
-            return self._interval_clicks
+        return self._interval_clicks
 
 
 if __name__ == '__main__':
@@ -8,13 +8,23 @@ Handles global key combinations for starting, stopping, and exiting the auto cli
 
 __author__ = 'sora7672'
 
-from threading import Thread, Lock, Event
+from threading import Thread, Event
 
 from pynput import mouse, keyboard
-from time import sleep
 
-from config_loader import ConfigHolder
-from click_worker import start_clicker, stop_clicker, is_clicker_alive
+from config_loader import ConfigHolder, sort_key_combo
+from click_worker import start_clicker, stop_clicker, shutdown_clicker, is_clicker_alive
+
+
+def to_hotkey_string(key_combo) -> str:
+    """
+    Converts a key combo into pynput's hotkey format, e.g. {"shift", "s"} to "<shift>+s".
+
+    :param key_combo: frozenset (Key names of the combo)
+    :return: str (Hotkey string for keyboard.HotKey.parse)
+    """
+
+    return '+'.join(k if len(k) == 1 else f'<{k}>' for k in sort_key_combo(key_combo))
 
 
 class HotkeyListener:
@@ -22,14 +32,12 @@ class HotkeyListener:
     Singleton class for monitoring keyboard input and triggering clicker actions based on user-defined hotkeys.
 
     Attributes:
-        _lock (Lock): Ensures thread-safe access to internal state
         _stop_event (Event): Signals listener thread to stop
         _thread (Thread): The background listener thread
         _clicker_alive (bool): Indicates whether the clicker is running
-        _current_pressed_keys (set[str]): Currently held keys
-        _exit_key_combo (set[str]): Key combo to exit application
-        _start_key_combo (set[str]): Key combo to start clicker
-        _stop_key_combo (set[str]): Key combo to stop clicker
+        _exit_key_combo (frozenset[str]): Key combo to exit application
+        _start_key_combo (frozenset[str]): Key combo to start clicker
+        _stop_key_combo (frozenset[str]): Key combo to stop clicker
     """
 
     _instance = None
@@ -56,12 +64,10 @@ class HotkeyListener:
             return
 
         self._initialized:bool = True
-        self._lock = Lock()
         self._stop_event = Event()
         self._thread = Thread(target=self.__key_listener)
         self._clicker_alive: bool = False
 
-        self._current_pressed_keys: set[str] = set()
         self.__set_settings()
 
         self._thread.start()
@@ -74,8 +80,7 @@ class HotkeyListener:
         :return: bool (Clicker running status)
         """
 
-        with self._lock:
-            return self._clicker_alive
+        return self._clicker_alive
 
     @clicker_alive.setter
     def clicker_alive(self, value: bool) -> None:
@@ -86,141 +91,116 @@ class HotkeyListener:
         :return: None (no return value)
         """
 
-        with self._lock:
-            self._clicker_alive = value
+        self._clicker_alive = value
 
     def __set_settings(self) -> None:
         """
-        Fetches hotkey combinations from the configuration and validates them.
+        Fetches the hotkey combinations, already validated by the configuration.
 
         :return: None (no return value)
         """
 
-        with self._lock:
-            self._exit_key_combo: set[str] = self.__validate_keys(ConfigHolder().exit_key_combo)
-            self._start_key_combo: set[str] = self.__validate_keys(ConfigHolder().start_key_combo)
-            self._stop_key_combo: set[str] = self.__validate_keys(ConfigHolder().stop_key_combo)
+        cfg = ConfigHolder()
+        self._exit_key_combo: frozenset[str] = cfg.exit_key_combo
+        self._start_key_combo: frozenset[str] = cfg.start_key_combo
+        self._stop_key_combo: frozenset[str] = cfg.stop_key_combo
 
-    def __validate_keys(self, key_tuple) -> set:
+    def __exit_program(self):
         """
-        Validates all key values in the given key combo.
+        Triggers the listener to stop and prepares program shutdown.
 
-        :param key_tuple: tuple (Tuple of key strings)
-        :return: set (Validated key set)
-        :raises TypeError: If a key is not a string
-        :raises ValueError: If a key is not lowercase or invalid
+        :return: None (no return value)
         """
 
-        for key_value in key_tuple:
-            if not isinstance(key_value, str):
-                raise TypeError(f'From ({key_tuple}) - Key {key_value} is not a string.')
+        self._stop_event.set()
 
-            if len(key_value) == 1 and not key_value.islower():
-                raise ValueError(f'From ({key_tuple}) - Key {key_value} is not lower case.')
+    def __on_exit(self) -> None:
+        """
+        Stops the clicker and exits when the exit hotkey is pressed.
 
-            if len(key_value) != 1 and not hasattr(keyboard.Key, key_value.lower()):
-                raise ValueError(f'From ({key_tuple}) - Key "{key_value}" is not a valid special key.')
+        :return: None (no return value)
+        """
 
-        return set(key_tuple)
+        # also ends the idle worker thread of a clicker that was started before
+        shutdown_clicker()
+        self.clicker_alive = False
+        self.__exit_program()
+        print("...SnakePit gracefully shut down.")
 
-    def __exit_program(self):
+    def __on_start(self) -> None:
         """
-        Triggers the listener to stop and prepares program shutdown.
+        Starts the clicker when the start hotkey is pressed and it is not running yet.
 
         :return: None (no return value)
         """
 
-        with self._lock:
-            self._stop_event.set()
+        if not self.clicker_alive:
+            start_clicker()
+            self.clicker_alive = True
 
-    def __check_hotkeys(self):
+    def __on_stop(self) -> None:
         """
-        Triggers the listener to stop and prepares program shutdown.
+        Stops the clicker when the stop hotkey is pressed and it is running.
 
         :return: None (no return value)
         """
 
-        with self._lock:
-            do_exit = all([k in self._current_pressed_keys for k in self._exit_key_combo])
-            do_stop = all([k in self._current_pressed_keys for k in self._stop_key_combo])
-            do_start = all([k in self._current_pressed_keys for k in self._start_key_combo])
-
-        if do_exit:
-            if self.clicker_alive:
-                stop_clicker()
-                self.clicker_alive = False
-            self.__exit_program()
-            print("...SnakePit gracefully shut down.")
-            return
-
         if self.clicker_alive:
-            if do_stop:
-                stop_clicker()
-                self.clicker_alive = False
-        else:
-            if do_start:
-                start_clicker()
-                self.clicker_alive = True
+            stop_clicker()
+            self.clicker_alive = False
 
-    def _get_key_value(self, key):
+    def __on_toggle(self) -> None:
         """
-        Converts a pynput key object to a lowercase string representation.
+        Starts or stops the clicker, used when start and stop share the same hotkey.
 
-        :param key: Key (pynput keyboard key object)
-        :return: str | None (Lowercase string or None)
+        :return: None (no return value)
         """
 
-        if not key or key is None:
-            return
-        if isinstance(key, keyboard.Key):
-            return key.name.lower()
+        if self.clicker_alive:
+            self.__on_stop()
         else:
-            if key.char is None:
-                return 
-            return key.char.lower()
+            self.__on_start()
 
-    def _key_push(self, key):
+    def __build_hotkeys(self) -> dict:
         """
-        Handles key press events by adding key to active set and checking hotkeys.
+        Maps the configured key combos to their callbacks for pynput's GlobalHotKeys.
 
-        :param key: Key (Pressed key object)
-        :return: None (no return value)
+        :return: dict (Hotkey string to callback)
         """
 
-        if not key or key is None:
-            return
-        key_value = self._get_key_value(key)
-        if key_value == "" or key_value is None:
-            return
-        with self._lock:
-            self._current_pressed_keys.add(key_value)
-        self.__check_hotkeys()
+        start_hotkey = to_hotkey_string(self._start_key_combo)
+        stop_hotkey = to_hotkey_string(self._stop_key_combo)
 
+        hotkeys = dict()
+        if start_hotkey == stop_hotkey:
+            hotkeys[start_hotkey] = self.__on_toggle
+        else:
+            hotkeys[start_hotkey] = self.__on_start
+            hotkeys[stop_hotkey] = self.__on_stop
+        hotkeys[to_hotkey_string(self._exit_key_combo)] = self.__on_exit
+        return hotkeys
 
-    def _key_release(self, key):
+    def wait_for_exit(self) -> None:
         """
-        Handles key release events by removing the key from active set.
+        Blocks until the exit hotkey was pressed and the listener thread has finished.
 
-        :param key: Key (Released key object)
         :return: None (no return value)
         """
 
-        if not key:
-            return
-        key_value = self._get_key_value(key)
-        with self._lock:
-            self._current_pressed_keys.discard(key_value)
+        self._stop_event.wait()
+        self._thread.join()
 
     def __key_listener(self):
         """
         Main keyboard listener loop that monitors for hotkey triggers.
+        pynput's HotKey fires once on the press completing a combo, so holding
+        a combo (key auto-repeat) does not trigger it again.
 
         :return: None (no return value)
         """
 
-        with keyboard.Listener(on_press=self._key_push, on_release=self._key_release) as listener:
-            while not self._stop_event.is_set():
-                sleep(0.1)
+        with keyboard.GlobalHotKeys(self.__build_hotkeys()) as listener:
+            self._stop_event.wait()
             listener.stop()
 
 
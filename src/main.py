@@ -12,8 +12,9 @@ __author__ = 'sora7672'
 # Later adding movements to mouse cursor
 # also adding key clicks per x seconds
 
-from config_loader import ConfigHolder
+from config_loader import ConfigHolder, sort_key_combo
 from hotkey_listener import HotkeyListener
+from click_worker import CLICK_HOLD_MS, HOLD_CLICK_MIN_INTERVAL
 
 
 def start_snakepit() -> None:
@@ -21,19 +22,22 @@ def start_snakepit() -> None:
     Initializes and starts the SnakePit clicker application.
 
     Loads configuration, displays click interval and key bindings,
-    and starts the hotkey listener.
+    and starts the hotkey listener. Blocks until the exit hotkey is pressed.
 
     :return: None (no return value)
     """
 
     print("Starting SnakePit...\n")
     cfg = ConfigHolder()
-    print(f"Click interval(ms): {cfg.interval_clicks} + 5ms between push+release ({cfg.interval_clicks + 5}ms)")
+    if cfg.interval_clicks >= HOLD_CLICK_MIN_INTERVAL:
+        print(f"Click interval(ms): {cfg.interval_clicks} (includes {CLICK_HOLD_MS}ms between push+release)")
+    else:
+        print(f"Click interval(ms): {cfg.interval_clicks} (instant push+release)")
     print(f"Key Bindings:\n"
-            f"Start Auto Clicker [{' + '.join([k.upper() for k in cfg.start_key_combo])}]\n"
-            f"Stop Auto Clicker [{' + '.join([k.upper() for k in cfg.stop_key_combo])}]\n"
-            f"Exit SnakePit [{' + '.join([k.upper() for k in cfg.exit_key_combo])}]")
-    HotkeyListener()
+            f"Start Auto Clicker [{' + '.join([k.upper() for k in sort_key_combo(cfg.start_key_combo)])}]\n"
+            f"Stop Auto Clicker [{' + '.join([k.upper() for k in sort_key_combo(cfg.stop_key_combo)])}]\n"
+            f"Exit SnakePit [{' + '.join([k.upper() for k in sort_key_combo(cfg.exit_key_combo)])}]")
+    HotkeyListener().wait_for_exit()
 
 
 if __name__ == '__main__':